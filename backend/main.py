@@ -3,103 +3,294 @@ FastAPI Server for Optical Link Budget Calculator
 All calculations included inline - no external module dependencies
 """
 
-from fastapi import FastAPI, HTTPException, Body
+from fastapi import FastAPI, HTTPException, Body, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, Dict, Any, List, Union
 import uvicorn
+import functools
+from dataclasses import dataclass
 from datetime import datetime
-import json
+import asyncio
+import contextlib
+import heapq
+import re
+import orjson
 import os
 import math
+import time
+import threading
 import tempfile
-import base64
+import hashlib
 import io
 
+import numpy as np
+
+from _kernels import link_budget_kernel
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Optical Link Budget Calculator API",
     description="Calculate optical communication link budgets with detailed analysis",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Enable CORS
+# Enable CORS. The frontend is either served same-origin from this app
+# (port 8000) or from the dev static server on 8080; an explicit allowlist
+# plus max_age lets browsers cache preflights instead of re-issuing one
+# per call.
+# Compress anything over 1 KiB — mainly the frontend JS/HTML served from
+# the static mount, but large sweep responses benefit too.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[
+        "http://localhost:8000", "http://127.0.0.1:8000",
+        "http://localhost:8080", "http://127.0.0.1:8080",
+    ],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type"],
+    max_age=3600,
 )
 
+# Validation errors echo the offending input back in the error detail, and
+# Starlette's default JSONResponse chokes on non-finite floats there (the
+# very values the finiteness validator rejects). orjson renders them as
+# null, so route 422s through the app's default response class.
+@app.exception_handler(RequestValidationError)
+async def _validation_error_handler(request: Request, exc: RequestValidationError):
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())},
+                          status_code=422)
+
+
 # Storage directory - use the user's Documents folder so it persists outside the temporary .exe
 import pathlib
 docs_dir = os.path.join(pathlib.Path.home(), "Documents", "OpticalLinkCalculations")
 STORAGE_DIR = docs_dir
 os.makedirs(STORAGE_DIR, exist_ok=True)
 
+# Listing metadata index so /api/saved reads one file instead of parsing
+# every saved calculation. Rebuilt from a directory scan when missing or
+# corrupt. Updates are read-modify-write, and the production launcher runs
+# several worker processes, so a threading.Lock alone isn't enough: the
+# mutation is guarded by an OS-level lock on a sidecar file (flock on
+# POSIX, msvcrt byte-range locking on Windows) plus an in-process lock so
+# threads in one worker don't contend for the file lock recursively.
+INDEX_FILE = os.path.join(STORAGE_DIR, "_index.json")
+_INDEX_LOCK_FILE = os.path.join(STORAGE_DIR, "_index.lock")
+_index_lock = threading.Lock()
+
+try:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f, fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f, fcntl.LOCK_UN)
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextlib.contextmanager
+def _index_guard():
+    with _index_lock:
+        # 'ab' creates the lock file on first use without truncating it
+        with open(_INDEX_LOCK_FILE, 'ab') as lf:
+            _lock_file(lf)
+            try:
+                yield
+            finally:
+                _unlock_file(lf)
+
+# \w in ASCII mode is [A-Za-z0-9_]; one C-level scan replaces the old
+# per-character generator expression
+_SAFE_NAME_RE = re.compile(r'[^\w \-]', re.ASCII)
+
+# Allowlist for stored-calculation filenames in load/delete; anything that
+# isn't a plain <safe-name>.json (no separators, no dot-dot) is rejected.
+# The leading character excludes '_' so internal files like the index stay
+# unreachable, matching the convention the rebuild scan already applies.
+_FILENAME_RE = re.compile(r'^[A-Za-z0-9][\w\-]*\.json$', re.ASCII)
+
+# Response timestamps only need second resolution, so the ISO string is
+# reformatted at most once per second however many requests arrive.
+_iso_now_cache = (0, "")
+
+def iso_now():
+    global _iso_now_cache
+    sec = int(time.time())
+    if sec != _iso_now_cache[0]:
+        _iso_now_cache = (sec, datetime.now().isoformat(timespec="seconds"))
+    return _iso_now_cache[1]
+
+def sanitize_name(name):
+    # Leading underscores are stripped so a saved file can never collide
+    # with the _-prefixed internal namespace (index, lock file); a name with
+    # nothing else left falls back to a generic stem
+    safe = _SAFE_NAME_RE.sub('', name).strip().replace(' ', '_').lstrip('_')
+    return safe or "calculation"
+
+def _read_json_file(filepath):
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
+def _write_json_file(filepath, data):
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+@functools.lru_cache(maxsize=256)
+def _load_calculation_cached(filepath, mtime):
+    # mtime is part of the key purely to invalidate the cache entry when the
+    # file on disk changes
+    return _read_json_file(filepath)
+
+def _write_index(entries):
+    # Write-then-rename so a crash mid-write can't leave a truncated index;
+    # a corrupt index would otherwise trigger a full directory rescan
+    tmp_path = INDEX_FILE + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(entries))
+    os.replace(tmp_path, INDEX_FILE)
+
+def _rebuild_index():
+    entries = []
+    # scandir yields name/path/type in one pass with no extra stat calls
+    with os.scandir(STORAGE_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith('.json') or entry.name.startswith('_') \
+                    or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, 'rb') as f:
+                    data = orjson.loads(f.read())
+                entries.append({
+                    "filename":  entry.name,
+                    "name":      data.get("name", "Unnamed"),
+                    "timestamp": data.get("timestamp", "Unknown"),
+                    "notes":     data.get("notes", "")
+                })
+            except Exception:
+                continue
+    _write_index(entries)
+    return entries
+
+def _load_index():
+    try:
+        with open(INDEX_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return _rebuild_index()
+
+def _index_add(entry):
+    with _index_guard():
+        entries = [e for e in _load_index() if e["filename"] != entry["filename"]]
+        entries.append(entry)
+        _write_index(entries)
+
+def _index_remove(filename):
+    with _index_guard():
+        entries = [e for e in _load_index() if e["filename"] != filename]
+        _write_index(entries)
+
 # ============= INLINE CALCULATIONS =============
 
 PI = math.pi
+FOUR_PI = 4 * math.pi
+LN10_OVER_10 = math.log(10) / 10  # 10**(x/10) == exp(x * ln(10)/10)
+# and the inverse direction: 10*log10(x) == (10/ln10) * ln(x)
+TEN_OVER_LN10 = 10 / math.log(10)
+TWENTY_OVER_LN10 = 20 / math.log(10)
 
+# The same dBm/linear values come back constantly (sweeps, saved-calculation
+# reloads, slider recomputes), so the pure conversions are memoized.
+
+@functools.lru_cache(maxsize=4096)
 def dbm_to_mw(dbm):
-    return 10 ** (dbm / 10)
+    return math.exp(dbm * LN10_OVER_10)
 
+@functools.lru_cache(maxsize=4096)
 def mw_to_dbm(mw):
     if mw <= 0:
         raise ValueError("Power must be positive")
-    return 10 * math.log10(mw)
+    return TEN_OVER_LN10 * math.log(mw)
 
 def dbm_to_w(dbm):
-    return dbm_to_mw(dbm) / 1000
+    # One exp instead of delegating through dbm_to_mw: mW -> W folds into
+    # a -30 dB shift inside the exponent.
+    return math.exp((dbm - 30.0) * LN10_OVER_10)
 
 def w_to_dbm(watts):
     return mw_to_dbm(watts * 1000)
 
+@functools.lru_cache(maxsize=4096)
 def linear_to_db(linear_value):
     if linear_value <= 0:
         raise ValueError("Linear value must be positive")
-    return 10 * math.log10(linear_value)
+    return TEN_OVER_LN10 * math.log(linear_value)
 
 def calculate_beam_divergence(wavelength_m, diameter_m):
     return 2.44 * (wavelength_m / diameter_m)
 
+@functools.lru_cache(maxsize=4096)
 def calculate_antenna_gain(efficiency, wavelength_m, diameter_m):
-    gain_abs = ((PI * diameter_m / wavelength_m) ** 2)
-    gain_db  = linear_to_db(gain_abs)
+    # 20*log10(x) == 10*log10(x**2), so the square feeds only the absolute
+    # gain and the log sees the unsquared argument
+    ratio    = PI * diameter_m / wavelength_m
+    gain_abs = ratio ** 2
+    gain_db  = TWENTY_OVER_LN10 * math.log(ratio)
     return gain_db, gain_abs
 
+@functools.lru_cache(maxsize=4096)
 def calculate_free_space_path_loss(distance_m, wavelength_m):
-    fspl    = ((4 * PI * distance_m) / wavelength_m) ** 2
-    fspl_db = linear_to_db(fspl)
-    return fspl_db
+    arg = FOUR_PI * distance_m / wavelength_m
+    if arg <= 0:
+        raise ValueError("Linear value must be positive")
+    return TWENTY_OVER_LN10 * math.log(arg)
+
+# Range checks as a (field, min, max, min_inclusive, message) table; one loop
+# replaces the old chain of per-field ifs. Only the raw-dict path (sweeps,
+# direct callers) needs this — pydantic already enforces the same
+# constraints on LinkBudgetInput before a handler runs.
+_REQUIRED_FIELDS = ('tx_power_dbm', 'tx_efficiency', 'rx_efficiency',
+                    'wavelength_m', 'tx_diameter_m', 'rx_diameter_m', 'distance_m')
+
+_RANGE_CHECKS = (
+    ('tx_efficiency', 0.0, 1.0, False, "TX efficiency must be between 0 and 1"),
+    ('rx_efficiency', 0.0, 1.0, False, "RX efficiency must be between 0 and 1"),
+    ('wavelength_m',  0.0, None, False, "Wavelength must be positive"),
+    ('tx_diameter_m', 0.0, None, False, "TX diameter must be positive"),
+    ('rx_diameter_m', 0.0, None, False, "RX diameter must be positive"),
+    ('distance_m',    0.0, None, False, "Distance must be positive"),
+    ('rx_lna_gain_db', 0.0, None, True, "Rx LNA gain must be 0 or positive"),
+)
 
 def validate_inputs(params):
-    errors = []
-    required = ['tx_power_dbm', 'tx_efficiency', 'rx_efficiency',
-                 'wavelength_m', 'tx_diameter_m', 'rx_diameter_m', 'distance_m']
-    for field in required:
-        if field not in params:
-            errors.append(f"Missing required field: {field}")
+    errors = [f"Missing required field: {field}"
+              for field in _REQUIRED_FIELDS if field not in params]
     if errors:
         return False, "; ".join(errors)
 
-    if not (0 < params['tx_efficiency'] <= 1):
-        errors.append("TX efficiency must be between 0 and 1")
-    if not (0 < params['rx_efficiency'] <= 1):
-        errors.append("RX efficiency must be between 0 and 1")
-    if params['wavelength_m'] <= 0:
-        errors.append("Wavelength must be positive")
-    if params['tx_diameter_m'] <= 0:
-        errors.append("TX diameter must be positive")
-    if params['rx_diameter_m'] <= 0:
-        errors.append("RX diameter must be positive")
-    if params['distance_m'] <= 0:
-        errors.append("Distance must be positive")
-    if params.get('rx_lna_gain_db', 0) < 0:
-        errors.append("Rx LNA gain must be 0 or positive")
+    for field, lo, hi, lo_inclusive, message in _RANGE_CHECKS:
+        value = params.get(field, 0)
+        if value is None:
+            value = 0
+        if (value < lo if lo_inclusive else value <= lo) or (hi is not None and value > hi):
+            errors.append(message)
 
     if errors:
         return False, "; ".join(errors)
@@ -109,175 +300,288 @@ def calculate_pointing_loss(gain_abs, error_rad):
     if not error_rad or error_rad <= 0:
         return 0.0
         
-    exponent = -gain_abs * (error_rad ** 2)
-    
-    # Safe fallback for extreme pointing error to prevent math range error
-    if exponent < -700:
-        return 1000.0
-        
-    loss_linear = math.exp(exponent)
-    
-    if loss_linear <= 0:
-         return 1000.0
+    # 10*log10(exp(-G*theta^2)) == -G*theta^2 * 10/ln10, computed directly
+    # in the dB domain; min() replaces the old exp-overflow branch and makes
+    # the 1000 dB cap monotonic instead of kicking in only past the point
+    # where exp() would have underflowed.
+    return min(gain_abs * (error_rad ** 2) * TEN_OVER_LN10, 1000.0)
+
+@dataclass(slots=True, frozen=True)
+class LinkBudgetResult:
+    """Flat, slotted result of one link budget calculation.
+
+    A slotted instance replaces the ~40-key nested dict the calculation used
+    to build per call; flatten_results turns it into the JSON payload.
+    """
+    tx_power_dbm:           float
+    tx_power_mw:            float
+    tx_efficiency_percent:  float
+    rx_efficiency_percent:  float
+    wavelength_m:           float
+    wavelength_nm:          float
+    tx_diameter_m:          float
+    rx_diameter_m:          float
+    distance_m:             float
+    distance_km:            float
+    rx_sensitivity_dbm:     Optional[float]
+    rx_sensitivity_mw:      Optional[float]
+    rx_lna_gain_db:         float
+    tx_gain_db:             float
+    tx_gain_abs:            float
+    rx_gain_db:             float
+    rx_gain_abs:            float
+    tx_theta_rad:           float
+    tx_theta_deg:           float
+    rx_theta_rad:           float
+    rx_theta_deg:           float
+    path_loss_db:           float
+    implementation_loss_db: float
+    coupling_loss_db:       float
+    tx_pointing_loss_db:    float
+    rx_pointing_loss_db:    float
+    total_loss_db:          float
+    received_power_dbm:     float
+    received_power_mw:      float
+    received_power_lna_dbm: float
+    received_power_lna_mw:  float
+    link_margin_db:         Optional[float]
+    link_viable:            Optional[bool]
 
-    loss_db = 10 * math.log10(loss_linear)
-    return abs(loss_db)
 
 def calculate_link_budget(params):
-    p_tx_dbm             = params['tx_power_dbm']
-    tx_efficiency        = params['tx_efficiency']
-    rx_efficiency        = params['rx_efficiency']
-    wavelength_m         = params['wavelength_m']
-    tx_diameter_m        = params['tx_diameter_m']
-    rx_diameter_m        = params['rx_diameter_m']
-    distance_m           = params['distance_m']
-    impl_loss_db         = params.get('implementation_loss_db', 0)
-    coupling_loss_db     = params.get('coupling_loss_db', 0)
-    tx_pointing_loss_db  = params.get('tx_pointing_loss_db', 0)
-    rx_pointing_loss_db  = params.get('rx_pointing_loss_db', 0)
-    tx_pointing_error_rad= params.get('tx_pointing_error_rad', None)
-    rx_pointing_error_rad= params.get('rx_pointing_error_rad', None)
-    p_rx_sensitivity_dbm = params.get('rx_sensitivity_dbm', None)
-    rx_lna_gain_db       = params.get('rx_lna_gain_db', 0)
-
-    tx_theta = calculate_beam_divergence(wavelength_m, tx_diameter_m)
-    rx_theta = calculate_beam_divergence(wavelength_m, rx_diameter_m)
-
-    g_tx_db, g_tx_abs = calculate_antenna_gain(tx_efficiency, wavelength_m, tx_diameter_m)
-    g_rx_db, g_rx_abs = calculate_antenna_gain(rx_efficiency, wavelength_m, rx_diameter_m)
+    # Thin extractor over the memoized core: identical parameter sets (sweep
+    # repeats, slider jitter back to a previous value, re-saves) hit the
+    # cache and reuse the frozen result object.
+    return _calculate_link_budget_cached(
+        params['tx_power_dbm'],
+        params['tx_efficiency'],
+        params['rx_efficiency'],
+        params['wavelength_m'],
+        params['tx_diameter_m'],
+        params['rx_diameter_m'],
+        params['distance_m'],
+        params.get('implementation_loss_db', 0),
+        params.get('coupling_loss_db', 0),
+        params.get('tx_pointing_loss_db', 0),
+        params.get('rx_pointing_loss_db', 0),
+        params.get('tx_pointing_error_rad', None),
+        params.get('rx_pointing_error_rad', None),
+        params.get('rx_sensitivity_dbm', None),
+        params.get('rx_lna_gain_db', 0),
+    )
 
+@functools.lru_cache(maxsize=1024)
+def _calculate_link_budget_cached(p_tx_dbm, tx_efficiency, rx_efficiency,
+                                  wavelength_m, tx_diameter_m, rx_diameter_m,
+                                  distance_m, impl_loss_db, coupling_loss_db,
+                                  tx_pointing_loss_db, rx_pointing_loss_db,
+                                  tx_pointing_error_rad, rx_pointing_error_rad,
+                                  p_rx_sensitivity_dbm, rx_lna_gain_db):
+    # Pointing loss from pointing error needs the absolute gain; this is the
+    # rare path, so it stays outside the JIT kernel.
     if tx_pointing_error_rad and tx_pointing_error_rad > 0:
+        g_tx_abs = (PI * tx_diameter_m / wavelength_m) ** 2
         tx_pointing_loss_db = calculate_pointing_loss(g_tx_abs, tx_pointing_error_rad)
-        
+
     if rx_pointing_error_rad and rx_pointing_error_rad > 0:
+        g_rx_abs = (PI * rx_diameter_m / wavelength_m) ** 2
         rx_pointing_loss_db = calculate_pointing_loss(g_rx_abs, rx_pointing_error_rad)
 
-    path_loss_db = calculate_free_space_path_loss(distance_m, wavelength_m)
+    (rcvd_power_dbm, rcvd_power_lna_dbm, link_margin_db,
+     g_tx_db, g_tx_abs, g_rx_db, g_rx_abs,
+     path_loss_db, total_loss_db, tx_theta, rx_theta) = link_budget_kernel(
+        float(p_tx_dbm), float(tx_efficiency), float(rx_efficiency),
+        float(wavelength_m), float(tx_diameter_m), float(rx_diameter_m),
+        float(distance_m), float(impl_loss_db), float(coupling_loss_db),
+        float(tx_pointing_loss_db), float(rx_pointing_loss_db),
+        float(rx_lna_gain_db),
+        float(p_rx_sensitivity_dbm) if p_rx_sensitivity_dbm is not None else math.nan)
+
+    rcvd_power_mw      = dbm_to_mw(rcvd_power_dbm)
+    rcvd_power_lna_mw  = dbm_to_mw(rcvd_power_lna_dbm)
+
+    # Link margin calculated AFTER LNA; NaN means no sensitivity was given
+    if p_rx_sensitivity_dbm is None:
+        link_margin_db = None
+
+    return LinkBudgetResult(
+        tx_power_dbm           = p_tx_dbm,
+        tx_power_mw            = dbm_to_mw(p_tx_dbm),
+        tx_efficiency_percent  = tx_efficiency * 100,
+        rx_efficiency_percent  = rx_efficiency * 100,
+        wavelength_m           = wavelength_m,
+        wavelength_nm          = wavelength_m * 1e9,
+        tx_diameter_m          = tx_diameter_m,
+        rx_diameter_m          = rx_diameter_m,
+        distance_m             = distance_m,
+        distance_km            = distance_m / 1000,
+        rx_sensitivity_dbm     = p_rx_sensitivity_dbm,
+        rx_sensitivity_mw      = dbm_to_mw(p_rx_sensitivity_dbm)
+                                 if p_rx_sensitivity_dbm is not None else None,
+        rx_lna_gain_db         = rx_lna_gain_db,
+        tx_gain_db             = g_tx_db,
+        tx_gain_abs            = g_tx_abs,
+        rx_gain_db             = g_rx_db,
+        rx_gain_abs            = g_rx_abs,
+        tx_theta_rad           = tx_theta,
+        tx_theta_deg           = math.degrees(tx_theta),
+        rx_theta_rad           = rx_theta,
+        rx_theta_deg           = math.degrees(rx_theta),
+        path_loss_db           = path_loss_db,
+        implementation_loss_db = impl_loss_db,
+        coupling_loss_db       = coupling_loss_db,
+        tx_pointing_loss_db    = tx_pointing_loss_db,
+        rx_pointing_loss_db    = rx_pointing_loss_db,
+        total_loss_db          = total_loss_db,
+        received_power_dbm     = rcvd_power_dbm,
+        received_power_mw      = rcvd_power_mw,
+        received_power_lna_dbm = rcvd_power_lna_dbm,
+        received_power_lna_mw  = rcvd_power_lna_mw,
+        link_margin_db         = link_margin_db,
+        link_viable            = link_margin_db > 0 if link_margin_db is not None else None,
+    )
+
+def _optional_term(params, key):
+    # None-aware default; `or 0` would ask a multi-element array for its
+    # truth value, which NumPy refuses
+    v = params.get(key)
+    return np.asarray(0.0 if v is None else v, dtype=float)
+
+def calculate_link_budget_batch(params):
+    """Vectorized link budget over NumPy arrays.
+
+    Each value in `params` may be a scalar or an array; all arrays are
+    broadcast to a common shape and every output is computed in a single
+    vectorized pass, so an N-point sweep costs one ufunc call per formula
+    instead of N Python-level calls through calculate_link_budget.
+    """
+    (p_tx_dbm, tx_efficiency, rx_efficiency, wavelength_m,
+     tx_diameter_m, rx_diameter_m, distance_m,
+     impl_loss_db, coupling_loss_db,
+     tx_pointing_loss_db, rx_pointing_loss_db,
+     rx_lna_gain_db) = np.broadcast_arrays(
+        np.asarray(params['tx_power_dbm'], dtype=float),
+        np.asarray(params['tx_efficiency'], dtype=float),
+        np.asarray(params['rx_efficiency'], dtype=float),
+        np.asarray(params['wavelength_m'], dtype=float),
+        np.asarray(params['tx_diameter_m'], dtype=float),
+        np.asarray(params['rx_diameter_m'], dtype=float),
+        np.asarray(params['distance_m'], dtype=float),
+        _optional_term(params, 'implementation_loss_db'),
+        _optional_term(params, 'coupling_loss_db'),
+        _optional_term(params, 'tx_pointing_loss_db'),
+        _optional_term(params, 'rx_pointing_loss_db'),
+        _optional_term(params, 'rx_lna_gain_db'),
+    )
+    p_rx_sensitivity_dbm  = params.get('rx_sensitivity_dbm', None)
+    tx_pointing_error_rad = params.get('tx_pointing_error_rad', None)
+    rx_pointing_error_rad = params.get('rx_pointing_error_rad', None)
+
+    tx_theta = 2.44 * (wavelength_m / tx_diameter_m)
+    rx_theta = 2.44 * (wavelength_m / rx_diameter_m)
+
+    # One elementwise reciprocal serves the gains and the path loss
+    inv_wl = 1.0 / wavelength_m
+
+    g_tx_abs = (PI * tx_diameter_m * inv_wl) ** 2
+    g_rx_abs = (PI * rx_diameter_m * inv_wl) ** 2
+    g_tx_db  = 10 * np.log10(g_tx_abs)
+    g_rx_db  = 10 * np.log10(g_rx_abs)
+
+    # A pointing error overrides an explicit pointing loss elementwise, the
+    # same precedence the scalar path applies; np.minimum keeps the scalar
+    # path's monotonic 1000 dB cap.
+    if tx_pointing_error_rad is not None:
+        err = np.asarray(tx_pointing_error_rad, dtype=float)
+        tx_pointing_loss_db = np.where(
+            err > 0,
+            np.minimum(g_tx_abs * err ** 2 * TEN_OVER_LN10, 1000.0),
+            tx_pointing_loss_db)
+    if rx_pointing_error_rad is not None:
+        err = np.asarray(rx_pointing_error_rad, dtype=float)
+        rx_pointing_loss_db = np.where(
+            err > 0,
+            np.minimum(g_rx_abs * err ** 2 * TEN_OVER_LN10, 1000.0),
+            rx_pointing_loss_db)
+
+    # 20*log10(x) is the algebraic simplification of 10*log10(x**2)
+    path_loss_db = 20 * np.log10(FOUR_PI * distance_m * inv_wl)
 
     total_loss_db = (path_loss_db + impl_loss_db + coupling_loss_db +
                      tx_pointing_loss_db + rx_pointing_loss_db)
 
-    rcvd_power_dbm = p_tx_dbm + g_tx_db + g_rx_db - total_loss_db + 10*math.log10(tx_efficiency)+ 10*math.log10(rx_efficiency)
-    rcvd_power_mw  = dbm_to_mw(rcvd_power_dbm)
-    rcvd_power_w   = dbm_to_w(rcvd_power_dbm)
-
-    # LNA adds directly to Rx power
+    rcvd_power_dbm = (p_tx_dbm + g_tx_db + g_rx_db - total_loss_db +
+                      10 * np.log10(tx_efficiency) + 10 * np.log10(rx_efficiency))
     rcvd_power_lna_dbm = rcvd_power_dbm + rx_lna_gain_db
-    rcvd_power_lna_mw  = dbm_to_mw(rcvd_power_lna_dbm)
-    rcvd_power_lna_w   = dbm_to_w(rcvd_power_lna_dbm)
-
-    # Link margin calculated AFTER LNA
-    link_margin_db = None
-    if p_rx_sensitivity_dbm is not None:
-        link_margin_db = rcvd_power_lna_dbm - p_rx_sensitivity_dbm
 
-    return {
-        'inputs': {
-            'tx_power_dbm':          p_tx_dbm,
-            'tx_power_mw':           dbm_to_mw(p_tx_dbm),
-            'tx_efficiency_percent': tx_efficiency * 100,
-            'rx_efficiency_percent': rx_efficiency * 100,
-            'wavelength_nm':         wavelength_m * 1e9,
-            'wavelength_m':          wavelength_m,
-            'tx_diameter_m':         tx_diameter_m,
-            'rx_diameter_m':         rx_diameter_m,
-            'distance_m':            distance_m,
-            'distance_km':           distance_m / 1000,
-            'rx_sensitivity_dbm':    p_rx_sensitivity_dbm,
-            'rx_lna_gain_db':        rx_lna_gain_db,
-        },
-        'antenna_gains': {
-            'tx_gain_db':  g_tx_db,
-            'tx_gain_abs': g_tx_abs,
-            'rx_gain_db':  g_rx_db,
-            'rx_gain_abs': g_rx_abs,
-        },
-        'beam_divergence': {
-            'tx_theta_rad': tx_theta,
-            'tx_theta_deg': math.degrees(tx_theta),
-            'rx_theta_rad': rx_theta,
-            'rx_theta_deg': math.degrees(rx_theta),
-        },
-        'losses': {
-            'path_loss_db':           path_loss_db,
-            'implementation_loss_db': impl_loss_db,
-            'coupling_loss_db':       coupling_loss_db,
-            'tx_pointing_loss_db':    tx_pointing_loss_db,
-            'rx_pointing_loss_db':    rx_pointing_loss_db,
-            'total_loss_db':          total_loss_db,
-        },
-        'received_power': {
-            'power_dbm': rcvd_power_dbm,
-            'power_mw':  rcvd_power_mw,
-            'power_w':   rcvd_power_w,
-        },
-        'received_power_with_lna': {
-            'power_dbm': rcvd_power_lna_dbm,
-            'power_mw':  rcvd_power_lna_mw,
-            'power_w':   rcvd_power_lna_w,
-        },
-        'link_margin': {
-            'margin_db':        link_margin_db,
-            'margin_available': link_margin_db is not None,
-            'link_viable':      link_margin_db > 0 if link_margin_db is not None else None,
-        },
+    results = {
+        'tx_gain_db':             g_tx_db,
+        'rx_gain_db':             g_rx_db,
+        'tx_beam_divergence_rad': tx_theta,
+        'rx_beam_divergence_rad': rx_theta,
+        'path_loss_db':           path_loss_db,
+        'total_loss_db':          total_loss_db,
+        'received_power_dbm':     rcvd_power_dbm,
+        'received_power_mw':      np.exp(rcvd_power_dbm * LN10_OVER_10),
+        'received_power_lna_dbm': rcvd_power_lna_dbm,
+        'link_margin_db':         None,
+        'link_viable':            None,
     }
 
-def flatten_results(raw: dict) -> dict:
-    inp  = raw.get('inputs', {})
-    ag   = raw.get('antenna_gains', {})
-    bd   = raw.get('beam_divergence', {})
-    ls   = raw.get('losses', {})
-    rp   = raw.get('received_power', {})
-    rpl  = raw.get('received_power_with_lna', {})
-    lm   = raw.get('link_margin', {})
+    if p_rx_sensitivity_dbm is not None:
+        link_margin_db = rcvd_power_lna_dbm - np.asarray(p_rx_sensitivity_dbm, dtype=float)
+        results['link_margin_db'] = link_margin_db
+        results['link_viable']    = link_margin_db > 0
 
-    rx_sens_dbm = inp.get('rx_sensitivity_dbm')
-    rx_sens_mw  = dbm_to_mw(rx_sens_dbm) if rx_sens_dbm is not None else None
+    return results
 
+
+def flatten_results(result: LinkBudgetResult) -> dict:
     return {
-        "tx_power_dbm":           inp.get('tx_power_dbm'),
-        "tx_power_mw":            inp.get('tx_power_mw'),
-        "rx_sensitivity_dbm":     rx_sens_dbm,
-        "rx_sensitivity_mw":      rx_sens_mw,
-        "rx_lna_gain_db":         inp.get('rx_lna_gain_db', 0),
-        "distance_m":             inp.get('distance_m'),
-        "distance_km":            inp.get('distance_km'),
-        "wavelength_nm":          inp.get('wavelength_nm'),
-        "tx_efficiency_percent":  inp.get('tx_efficiency_percent'),
-        "rx_efficiency_percent":  inp.get('rx_efficiency_percent'),
-        "tx_gain_db":             ag.get('tx_gain_db'),
-        "tx_gain_absolute":       ag.get('tx_gain_abs'),
-        "rx_gain_db":             ag.get('rx_gain_db'),
-        "rx_gain_absolute":       ag.get('rx_gain_abs'),
-        "tx_beam_divergence_rad": bd.get('tx_theta_rad'),
-        "tx_beam_divergence_deg": bd.get('tx_theta_deg'),
-        "rx_beam_divergence_rad": bd.get('rx_theta_rad'),
-        "rx_beam_divergence_deg": bd.get('rx_theta_deg'),
-        "path_loss_db":           ls.get('path_loss_db'),
-        "impl_loss_db":           ls.get('implementation_loss_db'),
-        "coupling_loss_db":       ls.get('coupling_loss_db'),
-        "tx_pointing_loss_db":    ls.get('tx_pointing_loss_db'),
-        "rx_pointing_loss_db":    ls.get('rx_pointing_loss_db'),
-        "total_loss_db":          ls.get('total_loss_db'),
-        "received_power_dbm":     rp.get('power_dbm'),
-        "received_power_mw":      rp.get('power_mw'),
-        "received_power_w":       rp.get('power_w'),
-        "received_power_lna_dbm": rpl.get('power_dbm'),
-        "received_power_lna_mw":  rpl.get('power_mw'),
-        "received_power_lna_w":   rpl.get('power_w'),
-        "link_margin_db":         lm.get('margin_db'),
-        "link_viable":            lm.get('link_viable'),
+        "tx_power_dbm":           result.tx_power_dbm,
+        "tx_power_mw":            result.tx_power_mw,
+        "rx_sensitivity_dbm":     result.rx_sensitivity_dbm,
+        "rx_sensitivity_mw":      result.rx_sensitivity_mw,
+        "rx_lna_gain_db":         result.rx_lna_gain_db,
+        "distance_m":             result.distance_m,
+        "distance_km":            result.distance_km,
+        "wavelength_nm":          result.wavelength_nm,
+        "tx_efficiency_percent":  result.tx_efficiency_percent,
+        "rx_efficiency_percent":  result.rx_efficiency_percent,
+        "tx_gain_db":             result.tx_gain_db,
+        "tx_gain_absolute":       result.tx_gain_abs,
+        "rx_gain_db":             result.rx_gain_db,
+        "rx_gain_absolute":       result.rx_gain_abs,
+        "tx_beam_divergence_rad": result.tx_theta_rad,
+        "tx_beam_divergence_deg": result.tx_theta_deg,
+        "rx_beam_divergence_rad": result.rx_theta_rad,
+        "rx_beam_divergence_deg": result.rx_theta_deg,
+        "path_loss_db":           result.path_loss_db,
+        "impl_loss_db":           result.implementation_loss_db,
+        "coupling_loss_db":       result.coupling_loss_db,
+        "tx_pointing_loss_db":    result.tx_pointing_loss_db,
+        "rx_pointing_loss_db":    result.rx_pointing_loss_db,
+        "total_loss_db":          result.total_loss_db,
+        "received_power_dbm":     result.received_power_dbm,
+        "received_power_mw":      result.received_power_mw,
+        "received_power_lna_dbm": result.received_power_lna_dbm,
+        "received_power_lna_mw":  result.received_power_lna_mw,
+        "link_margin_db":         result.link_margin_db,
+        "link_viable":            result.link_viable,
     }
 
 
 # ============= DATA MODELS =============
 
 class LinkBudgetInput(BaseModel):
+    # Frozen: validated inputs are never mutated, and an immutable model
+    # lets pydantic skip per-field mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
+
     tx_power_dbm:           float           = Field(..., description="Transmitter power in dBm")
-    tx_efficiency:          float           = Field(..., ge=0, le=1)
+    tx_efficiency:          float           = Field(..., gt=0, le=1)
     tx_diameter_m:          float           = Field(..., gt=0)
-    rx_efficiency:          float           = Field(..., ge=0, le=1)
+    rx_efficiency:          float           = Field(..., gt=0, le=1)
     rx_diameter_m:          float           = Field(..., gt=0)
     rx_sensitivity_dbm:     Optional[float] = Field(None)
     rx_lna_gain_db:         Optional[float] = Field(0.0, ge=0)
@@ -290,6 +594,17 @@ class LinkBudgetInput(BaseModel):
     tx_pointing_error_rad:  Optional[float] = Field(None, ge=0)
     rx_pointing_error_rad:  Optional[float] = Field(None, ge=0)
 
+    # The range constraints above don't exclude inf/nan (inf > 0 holds and
+    # nan compares false everywhere), and stdlib json happily parses both.
+    # Reject them here so they 422 instead of poisoning the kernel, the
+    # result caches and the saved-calculation files downstream.
+    @field_validator("*")
+    @classmethod
+    def _must_be_finite(cls, v):
+        if isinstance(v, float) and not math.isfinite(v):
+            raise ValueError("must be a finite number")
+        return v
+
 
 class SaveCalculationRequest(BaseModel):
     calculation_name: str           = Field(..., min_length=1, max_length=100)
@@ -298,6 +613,73 @@ class SaveCalculationRequest(BaseModel):
     notes:            Optional[str] = Field(None, max_length=500)
 
 
+FloatOrArray = Union[float, List[float]]
+
+class BatchLinkBudgetInput(BaseModel):
+    """Batch variant of LinkBudgetInput: every field may be a scalar or a
+    list; lists are broadcast together NumPy-style."""
+    tx_power_dbm:           FloatOrArray           = Field(...)
+    tx_efficiency:          FloatOrArray           = Field(...)
+    tx_diameter_m:          FloatOrArray           = Field(...)
+    rx_efficiency:          FloatOrArray           = Field(...)
+    rx_diameter_m:          FloatOrArray           = Field(...)
+    rx_sensitivity_dbm:     Optional[FloatOrArray] = Field(None)
+    rx_lna_gain_db:         Optional[FloatOrArray] = Field(0.0)
+    wavelength_m:           FloatOrArray           = Field(...)
+    distance_m:             FloatOrArray           = Field(...)
+    implementation_loss_db: Optional[FloatOrArray] = Field(0.0)
+    coupling_loss_db:       Optional[FloatOrArray] = Field(0.0)
+    tx_pointing_loss_db:    Optional[FloatOrArray] = Field(0.0)
+    rx_pointing_loss_db:    Optional[FloatOrArray] = Field(0.0)
+    tx_pointing_error_rad:  Optional[FloatOrArray] = Field(None)
+    rx_pointing_error_rad:  Optional[FloatOrArray] = Field(None)
+
+    # Field() bounds don't reach inside lists, so the batch model mirrors
+    # LinkBudgetInput's constraints per element; without these the batch
+    # endpoints accepted values the scalar path 422s and returned 200s full
+    # of nulls (NaN from np.log10, serialized as null by orjson).
+    @field_validator("*")
+    @classmethod
+    def _elements_finite(cls, v):
+        for x in (v if isinstance(v, list) else (v,)):
+            if isinstance(x, float) and not math.isfinite(x):
+                raise ValueError("must be a finite number")
+        return v
+
+    @field_validator("wavelength_m", "tx_diameter_m", "rx_diameter_m",
+                     "distance_m")
+    @classmethod
+    def _elements_positive(cls, v):
+        if any(x <= 0 for x in (v if isinstance(v, list) else (v,))):
+            raise ValueError("must be positive")
+        return v
+
+    @field_validator("tx_efficiency", "rx_efficiency")
+    @classmethod
+    def _elements_unit_interval(cls, v):
+        if any(not 0 < x <= 1 for x in (v if isinstance(v, list) else (v,))):
+            raise ValueError("must be between 0 and 1")
+        return v
+
+    @field_validator("rx_lna_gain_db", "implementation_loss_db",
+                     "coupling_loss_db", "tx_pointing_loss_db",
+                     "rx_pointing_loss_db", "tx_pointing_error_rad",
+                     "rx_pointing_error_rad")
+    @classmethod
+    def _elements_non_negative(cls, v):
+        if v is not None and \
+                any(x < 0 for x in (v if isinstance(v, list) else (v,))):
+            raise ValueError("must be 0 or positive")
+        return v
+
+
+class BatchCalculateRequest(BaseModel):
+    """One set of base inputs plus explicit values for a single swept field."""
+    base:         LinkBudgetInput
+    sweep_field:  str         = Field(..., description="Field name to sweep (e.g. 'distance_m')")
+    sweep_values: List[float] = Field(..., min_length=1)
+
+
 class SweepRequest(BaseModel):
     base_inputs:  LinkBudgetInput
     sweep_param:  str   = Field(..., description="Field name to sweep (e.g. 'distance_m')")
@@ -311,30 +693,46 @@ class SweepRequest(BaseModel):
 
 
 # ============= API ENDPOINTS =============
+# Note: endpoints deliberately return plain dicts / raw responses with no
+# response_model= — declaring one makes FastAPI re-validate every response
+# through pydantic, which costs several times the calculation itself.
+
+# Everything but the timestamp is static, so the JSON is pre-serialized
+# and only the timestamp bytes are spliced in per request.
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return Response(_HEALTH_PREFIX + iso_now().encode() + b'"}',
+                    media_type="application/json")
 
 
 @app.post("/api/calculate")
-async def calculate_link_budget_endpoint(inputs: LinkBudgetInput):
+async def calculate_link_budget_endpoint(inputs: LinkBudgetInput, request: Request):
     try:
-        params = inputs.dict()
-
-        is_valid, error_msg = validate_inputs(params)
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
+        # Dump once and reuse for the calculation and the echo; pydantic has
+        # already validated the model, so no second validate_inputs pass
+        params = inputs.model_dump()
+
+        # The result is a pure function of the inputs, so an ETag over the
+        # canonicalized input dict lets clients replay identical requests
+        # (slider jitter, tab refreshes) from their HTTP cache with a 304.
+        etag = '"%s"' % hashlib.blake2b(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS),
+            digest_size=16).hexdigest()
+        cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=3600"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
 
         raw_results  = calculate_link_budget(params)
         flat_outputs = flatten_results(raw_results)
 
-        return {
+        return ORJSONResponse({
             "success":   True,
-            "timestamp": datetime.now().isoformat(),
-            "inputs":    inputs.dict(),
+            "timestamp": iso_now(),
+            "inputs":    params,
             "outputs":   flat_outputs
-        }
+        }, headers=cache_headers)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -342,13 +740,83 @@ async def calculate_link_budget_endpoint(inputs: LinkBudgetInput):
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
 
+@app.post("/api/calculate/sweep")
+async def calculate_link_budget_sweep_endpoint(inputs: BatchLinkBudgetInput):
+    """Vectorized batch calculation: pass arrays for any subset of the
+    parameters (e.g. {"distance_m": [...], ...}) and get arrays back."""
+    try:
+        results = calculate_link_budget_batch(inputs.model_dump())
+
+        # np.generic covers the 0-d case: an all-scalar request broadcasts to
+        # 0-d arrays whose comparisons yield NumPy scalars, not ndarrays
+        outputs = {
+            key: (value.tolist() if isinstance(value, (np.ndarray, np.generic))
+                  else value)
+            for key, value in results.items()
+        }
+
+        num_points = len(outputs['received_power_dbm']) \
+            if isinstance(outputs['received_power_dbm'], list) else 1
+
+        return {
+            "success":    True,
+            "timestamp":  iso_now(),
+            "num_points": num_points,
+            "outputs":    outputs
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Sweep calculation error: {str(e)}")
+
+
+@app.post("/api/calculate_batch")
+async def calculate_link_budget_batch_endpoint(request: BatchCalculateRequest):
+    """Sweep one field over an explicit list of values in a single vectorized
+    pass (one NumPy evaluation instead of N scalar calls)."""
+    try:
+        params = request.base.model_dump()
+        if request.sweep_field not in params:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown sweep field: {request.sweep_field}")
+        params[request.sweep_field] = request.sweep_values
+        # Re-validate through the batch model so the injected sweep values
+        # face the same per-element constraints as the base fields; a
+        # ValidationError is a ValueError, so the 400 handler below fires.
+        params = BatchLinkBudgetInput(**params).model_dump()
+
+        results = calculate_link_budget_batch(params)
+
+        outputs = {
+            key: (value.tolist() if isinstance(value, (np.ndarray, np.generic))
+                  else value)
+            for key, value in results.items()
+        }
+
+        return {
+            "success":      True,
+            "timestamp":    iso_now(),
+            "sweep_field":  request.sweep_field,
+            "num_points":   len(request.sweep_values),
+            "outputs":      outputs
+        }
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch calculation error: {str(e)}")
+
+
 @app.post("/api/sweep")
 async def sweep_link_budget_endpoint(request: SweepRequest):
     """Run a parameter sweep: vary one parameter from sweep_min to sweep_max
     in sweep_steps intervals (sweep_steps+1 total points), return all results."""
     try:
-        with open("last_sweep_req.json", "w") as f:
-            json.dump(request.dict(), f, indent=2)
+        with open("last_sweep_req.json", "wb") as f:
+            f.write(orjson.dumps(request.model_dump(), option=orjson.OPT_INDENT_2))
             
         num_points = request.sweep_steps + 1
         step_size  = (request.sweep_max - request.sweep_min) / request.sweep_steps if request.sweep_steps > 0 else 0
@@ -360,7 +828,7 @@ async def sweep_link_budget_endpoint(request: SweepRequest):
             sweep_values2 = [request.sweep_min2 + i * step_size2 for i in range(num_points)]
 
         # Validate the sweep param exists on the model
-        base_dict = request.base_inputs.dict()
+        base_dict = request.base_inputs.model_dump()
         if request.sweep_param not in base_dict:
             raise HTTPException(status_code=400, detail=f"Unknown sweep parameter: {request.sweep_param}")
             
@@ -395,7 +863,7 @@ async def sweep_link_budget_endpoint(request: SweepRequest):
             "sweep_steps": request.sweep_steps,
             "num_points":  num_points,
             "results":     sweep_results,
-            "timestamp":   datetime.now().isoformat()
+            "timestamp":   iso_now()
         }
 
     except HTTPException:
@@ -410,22 +878,26 @@ async def sweep_link_budget_endpoint(request: SweepRequest):
 async def save_calculation(request: SaveCalculationRequest):
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = "".join(
-            c for c in request.calculation_name if c.isalnum() or c in (' ', '-', '_')
-        ).strip().replace(' ', '_')
+        safe_name = sanitize_name(request.calculation_name)
         filename = f"{safe_name}_{timestamp}.json"
         filepath = os.path.join(STORAGE_DIR, filename)
 
         save_data = {
             "name":      request.calculation_name,
-            "timestamp": datetime.now().isoformat(),
-            "inputs":    request.inputs.dict(),
+            "timestamp": iso_now(),
+            "inputs":    request.inputs.model_dump(),
             "results":   request.results,
             "notes":     request.notes
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        await asyncio.to_thread(_write_json_file, filepath, save_data)
+
+        await asyncio.to_thread(_index_add, {
+            "filename":  filename,
+            "name":      request.calculation_name,
+            "timestamp": save_data["timestamp"],
+            "notes":     request.notes or ""
+        })
 
         return {"success": True, "message": "Saved successfully", "filename": filename}
 
@@ -434,360 +906,76 @@ async def save_calculation(request: SaveCalculationRequest):
 
 
 @app.get("/api/saved")
-async def list_saved_calculations():
+async def list_saved_calculations(limit: Optional[int] = None, offset: int = 0):
     try:
-        saved_calcs = []
-        if os.path.exists(STORAGE_DIR):
-            for filename in os.listdir(STORAGE_DIR):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(STORAGE_DIR, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = json.load(f)
-                            saved_calcs.append({
-                                "filename":  filename,
-                                "name":      data.get("name", "Unnamed"),
-                                "timestamp": data.get("timestamp", "Unknown"),
-                                "notes":     data.get("notes", "")
-                            })
-                    except Exception:
-                        continue
-        saved_calcs.sort(key=lambda x: x["timestamp"], reverse=True)
-        return {"success": True, "count": len(saved_calcs), "calculations": saved_calcs}
+        entries = await asyncio.to_thread(_load_index)
+        total = len(entries)
+        if limit is not None:
+            # top-(offset+limit) by timestamp without sorting the full list
+            saved_calcs = heapq.nlargest(offset + limit, entries,
+                                         key=lambda x: x["timestamp"])[offset:]
+        else:
+            saved_calcs = sorted(entries, key=lambda x: x["timestamp"], reverse=True)
+            if offset:
+                saved_calcs = saved_calcs[offset:]
+        return {"success": True, "count": total, "calculations": saved_calcs}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing: {str(e)}")
 
 
 @app.get("/api/load/{filename}")
-async def load_calculation(filename: str):
+async def load_calculation(filename: str, request: Request):
+    if not _FILENAME_RE.match(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+    filepath = os.path.join(STORAGE_DIR, filename)
     try:
-        filepath = os.path.join(STORAGE_DIR, filename)
-        if not os.path.exists(filepath):
-            raise HTTPException(status_code=404, detail="Calculation not found")
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return {"success": True, "data": data}
+        # stat doubles as the existence check and feeds both the read cache
+        # and the ETag; saves can overwrite a name, so clients must
+        # revalidate (no-cache), but the mtime/size ETag makes that a 304
+        st = await asyncio.to_thread(os.stat, filepath)
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
+        data = await asyncio.to_thread(_load_calculation_cached, filepath, st.st_mtime)
+        return ORJSONResponse({"success": True, "data": data}, headers=cache_headers)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Calculation not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading: {str(e)}")
 
 
 @app.delete("/api/delete/{filename}")
 async def delete_calculation(filename: str):
+    if not _FILENAME_RE.match(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+    filepath = os.path.join(STORAGE_DIR, filename)
     try:
-        filepath = os.path.join(STORAGE_DIR, filename)
-        if not os.path.exists(filepath):
-            raise HTTPException(status_code=404, detail="Calculation not found")
-        os.remove(filepath)
+        await asyncio.to_thread(os.remove, filepath)
+        await asyncio.to_thread(_index_remove, filename)
         return {"success": True, "message": "Deleted successfully"}
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Calculation not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting: {str(e)}")
 
 
 # ============= PDF GENERATION =============
+# reportlab is the heaviest import in the dependency tree and PDFs are a
+# rare operation, so pdf_generator (and with it reportlab) is imported
+# lazily inside the endpoint rather than at startup.
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.pdfgen import canvas
-from reportlab.lib.enums import TA_CENTER
-
-
-class WatermarkCanvas(canvas.Canvas):
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self.pages = []
-
-    def showPage(self):
-        self.pages.append(dict(self.__dict__))
-        self._startPage()
-
-    def save(self):
-        num_pages = len(self.pages)
-        for page_num, page in enumerate(self.pages, 1):
-            self.__dict__.update(page)
-            self.draw_watermark(page_num, num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-
-    def draw_watermark(self, page_num, total_pages):
-        self.saveState()
-        self.setFillColorRGB(0.9, 0.9, 0.9, alpha=0.3)
-        self.setFont("Helvetica-Bold", 60)
-        self.translate(letter[0] / 2, letter[1] / 2)
-        self.rotate(45)
-        self.drawCentredString(0, 0, "OPTICAL LINK CALCULATOR")
-        self.restoreState()
-        self.saveState()
-        self.setFillColorRGB(0.3, 0.3, 0.3)
-        self.setFont("Helvetica", 8)
-        self.drawString(0.5 * inch, 0.5 * inch,
-            f"Generated by Optical Link Budget Calculator | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.drawRightString(letter[0] - 0.5 * inch, 0.5 * inch, f"Page {page_num} of {total_pages}")
-        self.restoreState()
-
-
-def generate_pdf_report(calculation_data: dict, output_path: str):
-    doc = SimpleDocTemplate(output_path, pagesize=letter,
-        rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=1*inch, bottomMargin=1*inch)
-    story = []
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('CustomTitle', parent=styles['Title'], fontSize=24,
-        textColor=colors.HexColor('#007bff'), spaceAfter=30, alignment=TA_CENTER)
-    heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading1'], fontSize=16,
-        textColor=colors.HexColor('#007bff'), spaceAfter=12, spaceBefore=12)
-    subheading_style = ParagraphStyle('CustomSubHeading', parent=styles['Heading2'], fontSize=13,
-        textColor=colors.HexColor('#0056b3'), spaceAfter=10, spaceBefore=10)
-    normal_style = styles['Normal']
-    inputs = calculation_data.get('inputs', {})
-    outputs = calculation_data.get('outputs', {})
-
-    story.append(Paragraph("Optical Link Budget Calculation Report", title_style))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}", normal_style))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("Input Parameters", heading_style))
-    story.append(Spacer(1, 0.1*inch))
-
-    lna_gain = inputs.get('rx_lna_gain_db', outputs.get('rx_lna_gain_db', 0)) or 0
-    input_data = [
-        ['Parameter', 'Value', 'Unit'],
-        ['Transmitter Power', f"{inputs.get('tx_power_dbm', outputs.get('tx_power_dbm', 0)):.2f} dBm  ({outputs.get('tx_power_mw', 0):.6f} mW)", ''],
-        ['Transmitter Efficiency', f"{inputs.get('tx_efficiency', 0) * 100 if inputs.get('tx_efficiency', 0) <= 1 else inputs.get('tx_efficiency', 0):.2f}", '%'],
-        ['Receiver Efficiency', f"{inputs.get('rx_efficiency', 0) * 100 if inputs.get('rx_efficiency', 0) <= 1 else inputs.get('rx_efficiency', 0):.2f}", '%'],
-        ['Receiver Sensitivity', f"{inputs.get('rx_sensitivity_dbm', outputs.get('rx_sensitivity_dbm', 0)):.2f} dBm  ({outputs.get('rx_sensitivity_mw', 0):.9f} mW)", ''],
-        ['Receiver Optical LNA Gain', f"{lna_gain:.2f}", 'dB'],
-        ['Optical Wavelength', f"{inputs.get('wavelength_m', 0) * 1e9:.2f}", 'nm'],
-        ['Transmitter Diameter', f"{inputs.get('tx_diameter_m', 0):.3f}", 'm'],
-        ['Receiver Diameter', f"{inputs.get('rx_diameter_m', 0):.3f}", 'm'],
-        ['Distance', f"{inputs.get('distance_m', 0):.2f} m  ({inputs.get('distance_m', 0) / 1000:.3f} km)", ''],
-        ['Implementation Loss', f"{inputs.get('implementation_loss_db', 0):.2f}", 'dB'],
-        ['Coupling Loss', f"{inputs.get('coupling_loss_db', 0):.2f}", 'dB'],
-        ['Tx Pointing Loss', f"{inputs.get('tx_pointing_loss_db', 0):.2f}", 'dB'],
-        ['Rx Pointing Loss', f"{inputs.get('rx_pointing_loss_db', 0):.2f}", 'dB'],
-    ]
-    input_table = Table(input_data, colWidths=[2.5*inch, 3.5*inch, 0.5*inch])
-    input_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#007bff')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 12),
-        ('BOTTOMPADDING', (0,0), (-1,0), 12), ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#f8f9fa')]),
-        ('BACKGROUND', (0,5), (-1,5), colors.HexColor('#e8f4ff')),
-        ('FONTNAME', (0,5), (-1,5), 'Helvetica-Bold'),
-    ]))
-    story.append(input_table)
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("Calculation Results", heading_style))
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("Antenna Gains", subheading_style))
-    gain_data = [
-        ['Parameter', 'Absolute', 'dB'],
-        ['Transmitter Gain', f"{outputs.get('tx_gain_absolute', 0):.4e}", f"{outputs.get('tx_gain_db', 0):.2f}"],
-        ['Receiver Gain', f"{outputs.get('rx_gain_absolute', 0):.4e}", f"{outputs.get('rx_gain_db', 0):.2f}"],
-    ]
-    gain_table = Table(gain_data, colWidths=[3*inch, 2*inch, 1.5*inch])
-    gain_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 11),
-        ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(gain_table)
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Beam Divergence", subheading_style))
-    divergence_data = [
-        ['Parameter', 'Radians', 'Degrees'],
-        ['Tx Beam Divergence', f"{outputs.get('tx_beam_divergence_rad', 0):.6e}", f"{outputs.get('tx_beam_divergence_deg', 0):.6f}"],
-        ['Rx Beam Divergence', f"{outputs.get('rx_beam_divergence_rad', 0):.6e}", f"{outputs.get('rx_beam_divergence_deg', 0):.6f}"],
-    ]
-    divergence_table = Table(divergence_data, colWidths=[3*inch, 2*inch, 1.5*inch])
-    divergence_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 11),
-        ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(divergence_table)
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Losses", subheading_style))
-    loss_data = [
-        ['Loss Type', 'Value (dB)'],
-        ['Free Space Path Loss', f"{outputs.get('path_loss_db', 0):.2f}"],
-        ['Implementation Loss', f"{outputs.get('impl_loss_db', 0):.2f}"],
-        ['Coupling Loss', f"{outputs.get('coupling_loss_db', 0):.2f}"],
-        ['Tx Pointing Loss', f"{outputs.get('tx_pointing_loss_db', 0):.2f}"],
-        ['Rx Pointing Loss', f"{outputs.get('rx_pointing_loss_db', 0):.2f}"],
-        ['Total Losses', f"{outputs.get('total_loss_db', 0):.2f}"],
-    ]
-    loss_table = Table(loss_data, colWidths=[4*inch, 2.5*inch])
-    loss_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTNAME', (0,-1), (-1,-1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,0), 11), ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0,1), (-1,-2), [colors.white, colors.HexColor('#f8f9fa')]),
-        ('BACKGROUND', (0,-1), (-1,-1), colors.HexColor('#ffc107')),
-    ]))
-    story.append(loss_table)
-    story.append(Spacer(1, 0.5*inch))
-    story.append(PageBreak())
-    story.append(Paragraph("Power Budget Summary", heading_style))
-    story.append(Spacer(1, 0.3*inch))
-
-    link_margin = outputs.get('link_margin_db', 0) or 0
-    lna_gain_val = outputs.get('rx_lna_gain_db', 0) or 0
-    if link_margin > 0:
-        status = "LINK VIABLE"
-        status_color = colors.HexColor('#28a745')
-        margin_bg = colors.HexColor('#d4edda')
-    else:
-        status = "LINK NOT VIABLE"
-        status_color = colors.HexColor('#dc3545')
-        margin_bg = colors.HexColor('#f8d7da')
-
-    margin_display = [['LINK MARGIN (After LNA Amplification)', f"{link_margin:.2f} dB"], ['STATUS', status]]
-    margin_table = Table(margin_display, colWidths=[3*inch, 3.5*inch])
-    margin_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,-1), margin_bg),
-        ('TEXTCOLOR', (0,0), (-1,-1), status_color),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 24),
-        ('GRID', (0,0), (-1,-1), 3, status_color),
-        ('TOPPADDING', (0,0), (-1,-1), 20),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 20),
-    ]))
-    story.append(margin_table)
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("Power Details", subheading_style))
-    power_data = [
-        ['Parameter', 'dBm', 'mW'],
-        ['Rx Power (Without LNA Amplification)', f"{outputs.get('received_power_dbm', 0):.2f}", f"{outputs.get('received_power_mw', 0):.6f}"],
-        [f"Rx Power (With LNA Amplification, +{lna_gain_val:.1f} dB)", f"{outputs.get('received_power_lna_dbm', 0):.2f}", f"{outputs.get('received_power_lna_mw', 0):.6f}"],
-        ['Receiver Sensitivity (Required)', f"{outputs.get('rx_sensitivity_dbm', 0):.2f}", f"{outputs.get('rx_sensitivity_mw', 0):.9f}"],
-        ['Transmitter Power', f"{outputs.get('tx_power_dbm', 0):.2f}", f"{outputs.get('tx_power_mw', 0):.6f}"],
-    ]
-    power_table = Table(power_data, colWidths=[3*inch, 1.5*inch, 2*inch])
-    power_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#007bff')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 11),
-        ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#f8f9fa')]),
-        ('BACKGROUND', (0,1), (-1,1), colors.HexColor('#fff3cd')),
-        ('BACKGROUND', (0,2), (-1,2), colors.HexColor('#d4edda')),
-        ('FONTNAME', (0,1), (-1,2), 'Helvetica-Bold'),
-    ]))
-    story.append(power_table)
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Efficiency Summary", subheading_style))
-    efficiency_data = [
-        ['Component', 'Efficiency (%)'],
-        ['Transmitter', f"{outputs.get('tx_efficiency_percent', 0):.2f}%"],
-        ['Receiver', f"{outputs.get('rx_efficiency_percent', 0):.2f}%"],
-    ]
-    efficiency_table = Table(efficiency_data, colWidths=[3*inch, 3.5*inch])
-    efficiency_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 11),
-        ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
-    story.append(efficiency_table)
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("Notes", subheading_style))
-    notes_text = (
-        "Rx Power (Without LNA Amplification) is the raw power at the receiver aperture. "
-        "Rx Power (With LNA Amplification) adds the Optical LNA gain directly to the raw Rx power. "
-        "Link Margin is computed using Rx Power WITH LNA Amplification minus Receiver Sensitivity. "
-        "Positive link margin means the link is viable. "
-        "A link margin of 3-6 dB is typically recommended for reliable operation. "
-        "This calculation assumes ideal atmospheric conditions. "
-        "Actual performance may vary based on environmental factors."
-    )
-    story.append(Paragraph(notes_text, normal_style))
+def _render_pdf_to_file(calculation_data, output_path):
+    # Build into memory first: reportlab otherwise issues many small writes,
+    # and rendering can take long enough to matter on the event loop, so the
+    # whole helper runs in a worker thread and ends with one file write.
+    from pdf_generator import generate_pdf_report
 
-    sweep_results = calculation_data.get('sweep_results')
-    if sweep_results:
-        story.append(PageBreak())
-        story.append(Paragraph("Parameter Sweep Analysis", heading_style))
-        story.append(Spacer(1, 0.2*inch))
-        
-        sweep_param_label = calculation_data.get('sweep_param_label', 'Sweep Parameter')
-        sweep_chart_base64 = calculation_data.get('sweep_chart_base64')
-        
-        if sweep_chart_base64:
-            try:
-                # Remove data:image/png;base64, prefix if it exists
-                if ',' in sweep_chart_base64:
-                    sweep_chart_base64 = sweep_chart_base64.split(',')[1]
-                
-                img_data = base64.b64decode(sweep_chart_base64)
-                img = Image(io.BytesIO(img_data))
-                
-                # Scale image to fit page width (letter width is 8.5 inches, margins are 0.75 each -> 7 inches available)
-                avail_width = 7 * inch
-                aspect = img.drawHeight / img.drawWidth
-                img.drawWidth = avail_width
-                img.drawHeight = avail_width * aspect
-                
-                story.append(img)
-                story.append(Spacer(1, 0.4*inch))
-            except Exception as e:
-                print(f"Failed to decode chart image: {e}")
-                
-        # Generate Table
-        story.append(Paragraph("Sweep Data Table", subheading_style))
-        story.append(Spacer(1, 0.1*inch))
-        
-        t_data = [[sweep_param_label, "Link Margin (dB)", "Rx Power LNA (dBm)", "Path Loss (dB)", "Viable?"]]
-        for r in sweep_results:
-            val = r.get('sweep_value', 0)
-            outputs_r = r.get('outputs', {})
-            lm = outputs_r.get('link_margin_db')
-            lm_str = f"{lm:.2f}" if lm is not None else "—"
-            rx_pwr = f"{outputs_r.get('received_power_lna_dbm', 0):.2f}"
-            path_loss = f"{outputs_r.get('path_loss_db', 0):.2f}"
-            viable = outputs_r.get('link_viable')
-            viable_str = "Yes" if viable is True else "No" if viable is False else "—"
-            
-            if val == 0:
-                val_str = "0"
-            elif abs(val) < 1e-3 or abs(val) > 1e4:
-                val_str = f"{val:.4e}"
-            else:
-                val_str = f"{val:.4f}"
-                
-            t_data.append([val_str, lm_str, rx_pwr, path_loss, viable_str])
-            
-        t_table = Table(t_data, colWidths=[1.7*inch, 1.2*inch, 1.5*inch, 1.3*inch, 1.0*inch])
-        t_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#007bff')),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,0), 10),
-            ('FONTSIZE', (0,1), (-1,-1), 9),
-            ('GRID', (0,0), (-1,-1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#f8f9fa')]),
-        ]))
-        story.append(t_table)
-
-    doc.build(story, canvasmaker=WatermarkCanvas)
-    return output_path
+    buf = io.BytesIO()
+    generate_pdf_report(calculation_data, buf)
+    with open(output_path, 'wb') as f:
+        f.write(buf.getvalue())
 
 
 @app.post("/api/generate-pdf")
@@ -799,16 +987,14 @@ async def generate_pdf(calculation_data: dict):
         # Try to extract the calculation name if it was passed inside the inputs dict or similar
         inputs_data = calculation_data.get('inputs', {})
         if isinstance(inputs_data, dict) and 'name' in inputs_data:
-            safe_name = "".join(
-                c for c in inputs_data['name'] if c.isalnum() or c in (' ', '-', '_')
-            ).strip().replace(' ', '_')
+            safe_name = sanitize_name(inputs_data['name'])
             if not safe_name:
                 safe_name = "optical_link_calculation"
                 
         filename = f"{safe_name}_{timestamp}.pdf"
         output_path = os.path.join(STORAGE_DIR, filename)
 
-        generate_pdf_report(calculation_data, output_path)
+        await asyncio.to_thread(_render_pdf_to_file, calculation_data, output_path)
         
         return {
             "success": True, 
@@ -844,10 +1030,29 @@ if os.path.exists(frontend_path):
 # ============= RUN SERVER =============
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+    if os.environ.get("LBSIM_DEV") == "1":
+        # Development: single worker with auto-reload
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # Production: one worker per CPU; uvloop/httptools are POSIX-only
+        extra = {}
+        if sys.platform != "win32":
+            extra = {"loop": "uvloop", "http": "httptools"}
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=os.cpu_count(),
+            log_level="warning",
+            access_log=False,
+            # Sliders fire bursts of /api/calculate from one browser; keep
+            # connections open so each burst reuses its TCP connection
+            timeout_keep_alive=60,
+            **extra
+        )
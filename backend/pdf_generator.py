@@ -3,219 +3,178 @@ PDF Report Generator for Optical Link Budget Calculator
 Generates professional PDFs with watermark
 """
 
-from reportlab.lib.pagesizes import letter, A4
+import base64
+import io
+from datetime import datetime
+
+from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.pdfgen import canvas
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from datetime import datetime
-import os
-
-
-class WatermarkCanvas(canvas.Canvas):
-    """Custom canvas class to add watermark to every page"""
-
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self.pages = []
-
-    def showPage(self):
-        self.pages.append(dict(self.__dict__))
-        self._startPage()
-
-    def save(self):
-        """Add watermark to all pages before saving"""
-        num_pages = len(self.pages)
-        for page_num, page in enumerate(self.pages, 1):
-            self.__dict__.update(page)
-            self.draw_watermark(page_num, num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-
-    def draw_watermark(self, page_num, total_pages):
-        """Draw watermark on each page"""
-        self.saveState()
-
-        # Diagonal watermark in center
-        self.setFillColorRGB(0.9, 0.9, 0.9, alpha=0.3)
-        self.setFont("Helvetica-Bold", 60)
-        self.translate(letter[0] / 2, letter[1] / 2)
-        self.rotate(45)
-        self.drawCentredString(0, 0, "OPTICAL LINK CALCULATOR")
-
-        self.restoreState()
-
-        # Footer
-        self.saveState()
-        self.setFillColorRGB(0.3, 0.3, 0.3)
-        self.setFont("Helvetica", 8)
-        self.drawString(
-            0.5 * inch, 0.5 * inch,
-            f"Generated by Optical Link Budget Calculator | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-        self.drawRightString(
-            letter[0] - 0.5 * inch, 0.5 * inch,
-            f"Page {page_num} of {total_pages}"
-        )
-        self.restoreState()
-
-
-def generate_pdf_report(calculation_data: dict, output_path: str):
+from reportlab.lib.enums import TA_CENTER
+
+# Paragraph and table styles are immutable per-process configuration, so
+# they are built once at import instead of on every report.
+_BLUE      = colors.HexColor('#007bff')
+_DARK_BLUE = colors.HexColor('#0056b3')
+_STRIPE    = colors.HexColor('#f8f9fa')
+
+_MARGINS = dict(rightMargin=0.75*inch, leftMargin=0.75*inch,
+                topMargin=1*inch, bottomMargin=1*inch)
+
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle('CustomTitle', parent=_STYLES['Title'], fontSize=24,
+    textColor=_BLUE, spaceAfter=30, alignment=TA_CENTER)
+_HEADING_STYLE = ParagraphStyle('CustomHeading', parent=_STYLES['Heading1'], fontSize=16,
+    textColor=_BLUE, spaceAfter=12, spaceBefore=12)
+_SUBHEADING_STYLE = ParagraphStyle('CustomSubHeading', parent=_STYLES['Heading2'], fontSize=13,
+    textColor=_DARK_BLUE, spaceAfter=10, spaceBefore=10)
+_NORMAL_STYLE = _STYLES['Normal']
+
+_INPUT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _BLUE),
+    ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 12),
+    ('BOTTOMPADDING', (0,0), (-1,0), 12), ('GRID', (0,0), (-1,-1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, _STRIPE]),
+    ('BACKGROUND', (0,5), (-1,5), colors.HexColor('#e8f4ff')),
+    ('FONTNAME', (0,5), (-1,5), 'Helvetica-Bold'),
+])
+
+# Shared by the gain, divergence and efficiency tables
+_SECTION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _DARK_BLUE),
+    ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 11),
+    ('GRID', (0,0), (-1,-1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, _STRIPE]),
+])
+
+_LOSS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _DARK_BLUE),
+    ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('FONTNAME', (0,-1), (-1,-1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,0), 11), ('GRID', (0,0), (-1,-1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0,1), (-1,-2), [colors.white, _STRIPE]),
+    ('BACKGROUND', (0,-1), (-1,-1), colors.HexColor('#ffc107')),
+])
+
+_POWER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _BLUE),
+    ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'), ('ALIGN', (1,0), (-1,-1), 'RIGHT'),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'), ('FONTSIZE', (0,0), (-1,0), 11),
+    ('GRID', (0,0), (-1,-1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, _STRIPE]),
+    ('BACKGROUND', (0,1), (-1,1), colors.HexColor('#fff3cd')),
+    ('BACKGROUND', (0,2), (-1,2), colors.HexColor('#d4edda')),
+    ('FONTNAME', (0,1), (-1,2), 'Helvetica-Bold'),
+])
+
+_SWEEP_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _BLUE),
+    ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,0), 10),
+    ('FONTSIZE', (0,1), (-1,-1), 9),
+    ('GRID', (0,0), (-1,-1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, _STRIPE]),
+])
+
+
+def _make_watermark(footer_text):
+    """Build the onPage callback: watermark + footer, drawn as each page is
+    emitted.
+
+    The old WatermarkCanvas subclass snapshotted the full canvas __dict__
+    per page and replayed everything in save(); the callback draws in one
+    pass with no per-page state kept around. The footer text (with the
+    generation timestamp) is formatted once per document and closed over,
+    not once per page.
     """
-    Generate a professional PDF report with calculation results.
-
-    Args:
-        calculation_data: Dictionary containing 'inputs' and 'outputs'
-        output_path:      Path where the PDF will be saved
-    """
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=0.75 * inch,
-        leftMargin=0.75 * inch,
-        topMargin=1 * inch,
-        bottomMargin=1 * inch
-    )
-
+    def _draw_watermark(canv, doc):
+        canv.saveState()
+        canv.setFillColorRGB(0.9, 0.9, 0.9, alpha=0.3)
+        canv.setFont("Helvetica-Bold", 60)
+        canv.translate(letter[0] / 2, letter[1] / 2)
+        canv.rotate(45)
+        canv.drawCentredString(0, 0, "OPTICAL LINK CALCULATOR")
+        canv.restoreState()
+        canv.saveState()
+        canv.setFillColorRGB(0.3, 0.3, 0.3)
+        canv.setFont("Helvetica", 8)
+        canv.drawString(0.5 * inch, 0.5 * inch, footer_text)
+        canv.drawRightString(letter[0] - 0.5 * inch, 0.5 * inch, f"Page {canv.getPageNumber()}")
+        canv.restoreState()
+    return _draw_watermark
+
+
+def generate_pdf_report(calculation_data: dict, output):
+    """Build the report into `output` — a path or a file-like object
+    (SimpleDocTemplate accepts either)."""
+    doc = SimpleDocTemplate(output, pagesize=letter, **_MARGINS)
     story = []
-    styles = getSampleStyleSheet()
-
-    title_style = ParagraphStyle(
-        'CustomTitle', parent=styles['Title'],
-        fontSize=24, textColor=colors.HexColor('#007bff'),
-        spaceAfter=30, alignment=TA_CENTER
-    )
-    heading_style = ParagraphStyle(
-        'CustomHeading', parent=styles['Heading1'],
-        fontSize=16, textColor=colors.HexColor('#007bff'),
-        spaceAfter=12, spaceBefore=12
-    )
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading', parent=styles['Heading2'],
-        fontSize=13, textColor=colors.HexColor('#0056b3'),
-        spaceAfter=10, spaceBefore=10
-    )
-    normal_style = styles['Normal']
-
-    inputs  = calculation_data.get('inputs', {})
+    inputs = calculation_data.get('inputs', {})
     outputs = calculation_data.get('outputs', {})
+    now = datetime.now()
 
-    # ── Title ──────────────────────────────────────────────────────────────
-    story.append(Paragraph("Optical Link Budget Calculation Report", title_style))
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph(
-        f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}",
-        normal_style
-    ))
-    story.append(Spacer(1, 0.5 * inch))
-
-    # ── Input Parameters ────────────────────────────────────────────────────
-    story.append(Paragraph("Input Parameters", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
+    story.append(Paragraph("Optical Link Budget Calculation Report", _TITLE_STYLE))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph(f"<b>Generated:</b> {now.strftime('%B %d, %Y at %H:%M:%S')}", _NORMAL_STYLE))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Input Parameters", _HEADING_STYLE))
+    story.append(Spacer(1, 0.1*inch))
 
     lna_gain = inputs.get('rx_lna_gain_db', outputs.get('rx_lna_gain_db', 0)) or 0
-
     input_data = [
         ['Parameter', 'Value', 'Unit'],
-        ['Transmitter Power',
-         f"{inputs.get('tx_power_dbm', outputs.get('tx_power_dbm', 0)):.2f} dBm"
-         f"  ({outputs.get('tx_power_mw', 0):.6f} mW)", ''],
-        ['Transmitter Efficiency',
-         f"{inputs.get('tx_efficiency', 0) * 100 if inputs.get('tx_efficiency', 0) <= 1 else inputs.get('tx_efficiency', 0):.2f}", '%'],
-        ['Receiver Efficiency',
-         f"{inputs.get('rx_efficiency', 0) * 100 if inputs.get('rx_efficiency', 0) <= 1 else inputs.get('rx_efficiency', 0):.2f}", '%'],
-        ['Receiver Sensitivity',
-         f"{inputs.get('rx_sensitivity_dbm', outputs.get('rx_sensitivity_dbm', 0)):.2f} dBm"
-         f"  ({outputs.get('rx_sensitivity_mw', 0):.9f} mW)", ''],
-        # NEW: Rx Optical LNA row
-        ['Rx Optical LNA Gain', f"{lna_gain:.2f}", 'dB'],
+        ['Transmitter Power', f"{inputs.get('tx_power_dbm', outputs.get('tx_power_dbm', 0)):.2f} dBm  ({outputs.get('tx_power_mw', 0):.6f} mW)", ''],
+        ['Transmitter Efficiency', f"{inputs.get('tx_efficiency', 0) * 100 if inputs.get('tx_efficiency', 0) <= 1 else inputs.get('tx_efficiency', 0):.2f}", '%'],
+        ['Receiver Efficiency', f"{inputs.get('rx_efficiency', 0) * 100 if inputs.get('rx_efficiency', 0) <= 1 else inputs.get('rx_efficiency', 0):.2f}", '%'],
+        ['Receiver Sensitivity', f"{inputs.get('rx_sensitivity_dbm', outputs.get('rx_sensitivity_dbm', 0)):.2f} dBm  ({outputs.get('rx_sensitivity_mw', 0):.9f} mW)", ''],
+        ['Receiver Optical LNA Gain', f"{lna_gain:.2f}", 'dB'],
         ['Optical Wavelength', f"{inputs.get('wavelength_m', 0) * 1e9:.2f}", 'nm'],
         ['Transmitter Diameter', f"{inputs.get('tx_diameter_m', 0):.3f}", 'm'],
         ['Receiver Diameter', f"{inputs.get('rx_diameter_m', 0):.3f}", 'm'],
-        ['Distance',
-         f"{inputs.get('distance_m', 0):.2f} m  ({inputs.get('distance_m', 0) / 1000:.3f} km)", ''],
+        ['Distance', f"{inputs.get('distance_m', 0):.2f} m  ({inputs.get('distance_m', 0) / 1000:.3f} km)", ''],
         ['Implementation Loss', f"{inputs.get('implementation_loss_db', 0):.2f}", 'dB'],
         ['Coupling Loss', f"{inputs.get('coupling_loss_db', 0):.2f}", 'dB'],
         ['Tx Pointing Loss', f"{inputs.get('tx_pointing_loss_db', 0):.2f}", 'dB'],
         ['Rx Pointing Loss', f"{inputs.get('rx_pointing_loss_db', 0):.2f}", 'dB'],
     ]
-
-    input_table = Table(input_data, colWidths=[2.5 * inch, 3.5 * inch, 0.5 * inch])
-    input_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#007bff')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-        # Highlight the LNA row (row index 5)
-        ('BACKGROUND', (0, 5), (-1, 5), colors.HexColor('#e8f4ff')),
-        ('FONTNAME', (0, 5), (-1, 5), 'Helvetica-Bold'),
-    ]))
+    input_table = Table(input_data, colWidths=[2.5*inch, 3.5*inch, 0.5*inch])
+    input_table.setStyle(_INPUT_TABLE_STYLE)
     story.append(input_table)
-    story.append(Spacer(1, 0.5 * inch))
-
-    # ── Calculation Results ─────────────────────────────────────────────────
-    story.append(Paragraph("Calculation Results", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
-
-    # Antenna Gains
-    story.append(Paragraph("Antenna Gains", subheading_style))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Calculation Results", _HEADING_STYLE))
+    story.append(Spacer(1, 0.1*inch))
+    story.append(Paragraph("Antenna Gains", _SUBHEADING_STYLE))
     gain_data = [
         ['Parameter', 'Absolute', 'dB'],
-        ['Transmitter Gain',
-         f"{outputs.get('tx_gain_absolute', 0):.4e}",
-         f"{outputs.get('tx_gain_db', 0):.2f}"],
-        ['Receiver Gain',
-         f"{outputs.get('rx_gain_absolute', 0):.4e}",
-         f"{outputs.get('rx_gain_db', 0):.2f}"],
+        ['Transmitter Gain', f"{outputs.get('tx_gain_absolute', 0):.4e}", f"{outputs.get('tx_gain_db', 0):.2f}"],
+        ['Receiver Gain', f"{outputs.get('rx_gain_absolute', 0):.4e}", f"{outputs.get('rx_gain_db', 0):.2f}"],
     ]
-    gain_table = Table(gain_data, colWidths=[3 * inch, 2 * inch, 1.5 * inch])
-    gain_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
+    gain_table = Table(gain_data, colWidths=[3*inch, 2*inch, 1.5*inch])
+    gain_table.setStyle(_SECTION_TABLE_STYLE)
     story.append(gain_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Beam Divergence
-    story.append(Paragraph("Beam Divergence", subheading_style))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph("Beam Divergence", _SUBHEADING_STYLE))
     divergence_data = [
         ['Parameter', 'Radians', 'Degrees'],
-        ['Tx Beam Divergence',
-         f"{outputs.get('tx_beam_divergence_rad', 0):.6e}",
-         f"{outputs.get('tx_beam_divergence_deg', 0):.6f}"],
-        ['Rx Beam Divergence',
-         f"{outputs.get('rx_beam_divergence_rad', 0):.6e}",
-         f"{outputs.get('rx_beam_divergence_deg', 0):.6f}"],
+        ['Tx Beam Divergence', f"{outputs.get('tx_beam_divergence_rad', 0):.6e}", f"{outputs.get('tx_beam_divergence_deg', 0):.6f}"],
+        ['Rx Beam Divergence', f"{outputs.get('rx_beam_divergence_rad', 0):.6e}", f"{outputs.get('rx_beam_divergence_deg', 0):.6f}"],
     ]
-    divergence_table = Table(divergence_data, colWidths=[3 * inch, 2 * inch, 1.5 * inch])
-    divergence_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
+    divergence_table = Table(divergence_data, colWidths=[3*inch, 2*inch, 1.5*inch])
+    divergence_table.setStyle(_SECTION_TABLE_STYLE)
     story.append(divergence_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Losses
-    story.append(Paragraph("Losses", subheading_style))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph("Losses", _SUBHEADING_STYLE))
     loss_data = [
         ['Loss Type', 'Value (dB)'],
         ['Free Space Path Loss', f"{outputs.get('path_loss_db', 0):.2f}"],
@@ -225,170 +184,133 @@ def generate_pdf_report(calculation_data: dict, output_path: str):
         ['Rx Pointing Loss', f"{outputs.get('rx_pointing_loss_db', 0):.2f}"],
         ['Total Losses', f"{outputs.get('total_loss_db', 0):.2f}"],
     ]
-    loss_table = Table(loss_data, colWidths=[4 * inch, 2.5 * inch])
-    loss_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, colors.HexColor('#f8f9fa')]),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ffc107')),
-    ]))
+    loss_table = Table(loss_data, colWidths=[4*inch, 2.5*inch])
+    loss_table.setStyle(_LOSS_TABLE_STYLE)
     story.append(loss_table)
-    story.append(Spacer(1, 0.5 * inch))
-
-    # ── Power Budget Summary (page 2) ───────────────────────────────────────
+    story.append(Spacer(1, 0.5*inch))
     story.append(PageBreak())
-    story.append(Paragraph("Power Budget Summary", heading_style))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph("Power Budget Summary", _HEADING_STYLE))
+    story.append(Spacer(1, 0.3*inch))
 
-    # Link Margin box (after LNA)
     link_margin = outputs.get('link_margin_db', 0) or 0
     lna_gain_val = outputs.get('rx_lna_gain_db', 0) or 0
-
     if link_margin > 0:
-        status       = "✓ LINK VIABLE"
+        status = "LINK VIABLE"
         status_color = colors.HexColor('#28a745')
-        margin_bg    = colors.HexColor('#d4edda')
+        margin_bg = colors.HexColor('#d4edda')
     else:
-        status       = "✗ LINK NOT VIABLE"
+        status = "LINK NOT VIABLE"
         status_color = colors.HexColor('#dc3545')
-        margin_bg    = colors.HexColor('#f8d7da')
+        margin_bg = colors.HexColor('#f8d7da')
 
-    margin_display = [
-        ['LINK MARGIN (After LNA)', f"{link_margin:.2f} dB"],
-        ['STATUS', status],
-    ]
-    margin_table = Table(margin_display, colWidths=[3 * inch, 3.5 * inch])
+    margin_display = [['LINK MARGIN (After LNA Amplification)', f"{link_margin:.2f} dB"], ['STATUS', status]]
+    margin_table = Table(margin_display, colWidths=[3*inch, 3.5*inch])
     margin_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), margin_bg),
-        ('TEXTCOLOR', (0, 0), (-1, -1), status_color),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 24),
-        ('GRID', (0, 0), (-1, -1), 3, status_color),
-        ('TOPPADDING', (0, 0), (-1, -1), 20),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+        ('BACKGROUND', (0,0), (-1,-1), margin_bg),
+        ('TEXTCOLOR', (0,0), (-1,-1), status_color),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,-1), 24),
+        ('GRID', (0,0), (-1,-1), 3, status_color),
+        ('TOPPADDING', (0,0), (-1,-1), 20),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 20),
     ]))
     story.append(margin_table)
-    story.append(Spacer(1, 0.5 * inch))
-
-    # Power Details — now shows all three key rows
-    story.append(Paragraph("Power Details", subheading_style))
-
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Power Details", _SUBHEADING_STYLE))
     power_data = [
         ['Parameter', 'dBm', 'mW'],
-        # 1. Rx power WITHOUT LNA
-        ['Rx Power (Without LNA Amplification)',
-         f"{outputs.get('received_power_dbm', 0):.2f}",
-         f"{outputs.get('received_power_mw', 0):.6f}"],
-        # 2. Rx power WITH LNA
-        [f'Rx Power (With LNA Amplification, +{lna_gain_val:.1f} dB)',
-         f"{outputs.get('received_power_lna_dbm', 0):.2f}",
-         f"{outputs.get('received_power_lna_mw', 0):.6f}"],
-        # Sensitivity threshold
-        ['Receiver Sensitivity (Required)',
-         f"{outputs.get('rx_sensitivity_dbm', 0):.2f}",
-         f"{outputs.get('rx_sensitivity_mw', 0):.9f}"],
-        # Tx power for reference
-        ['Transmitter Power',
-         f"{outputs.get('tx_power_dbm', 0):.2f}",
-         f"{outputs.get('tx_power_mw', 0):.6f}"],
+        ['Rx Power (Without LNA Amplification)', f"{outputs.get('received_power_dbm', 0):.2f}", f"{outputs.get('received_power_mw', 0):.6f}"],
+        [f"Rx Power (With LNA Amplification, +{lna_gain_val:.1f} dB)", f"{outputs.get('received_power_lna_dbm', 0):.2f}", f"{outputs.get('received_power_lna_mw', 0):.6f}"],
+        ['Receiver Sensitivity (Required)', f"{outputs.get('rx_sensitivity_dbm', 0):.2f}", f"{outputs.get('rx_sensitivity_mw', 0):.9f}"],
+        ['Transmitter Power', f"{outputs.get('tx_power_dbm', 0):.2f}", f"{outputs.get('tx_power_mw', 0):.6f}"],
     ]
-
-    power_table = Table(power_data, colWidths=[3 * inch, 1.5 * inch, 2 * inch])
-    power_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#007bff')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-        # Highlight the two Rx power rows
-        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#fff3cd')),   # Without LNA - amber tint
-        ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#d4edda')),   # With LNA    - green tint
-        ('FONTNAME', (0, 1), (-1, 2), 'Helvetica-Bold'),
-    ]))
+    power_table = Table(power_data, colWidths=[3*inch, 1.5*inch, 2*inch])
+    power_table.setStyle(_POWER_TABLE_STYLE)
     story.append(power_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Efficiency Summary
-    story.append(Paragraph("Efficiency Summary", subheading_style))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph("Efficiency Summary", _SUBHEADING_STYLE))
     efficiency_data = [
         ['Component', 'Efficiency (%)'],
         ['Transmitter', f"{outputs.get('tx_efficiency_percent', 0):.2f}%"],
         ['Receiver', f"{outputs.get('rx_efficiency_percent', 0):.2f}%"],
     ]
-    efficiency_table = Table(efficiency_data, colWidths=[3 * inch, 3.5 * inch])
-    efficiency_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
+    efficiency_table = Table(efficiency_data, colWidths=[3*inch, 3.5*inch])
+    efficiency_table.setStyle(_SECTION_TABLE_STYLE)
     story.append(efficiency_table)
-    story.append(Spacer(1, 0.5 * inch))
-
-    # Notes
-    story.append(Paragraph("Notes", subheading_style))
-    notes_text = """
-    • Rx Power (Without LNA Amplification) is the raw power at the receiver aperture.
-    • Rx Power (With LNA Amplification) adds the Optical LNA gain to the raw Rx power.
-    • Link Margin is computed using Rx Power WITH LNA Amplification minus Receiver Sensitivity.
-    • Positive link margin means the link is viable.
-    • A link margin of 3-6 dB is typically recommended for reliable operation.
-    • This calculation assumes ideal atmospheric conditions.
-    • Actual performance may vary based on environmental factors.
-    """
-    story.append(Paragraph(notes_text, normal_style))
-
-    # Build PDF with watermark
-    doc.build(story, canvasmaker=WatermarkCanvas)
-    return output_path
-
-
-# FastAPI endpoint integration
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
-import tempfile
-
-
-def create_pdf_endpoint(app: FastAPI):
-    """Add PDF generation endpoint to FastAPI app"""
-
-    @app.post("/api/generate-pdf")
-    async def generate_pdf(calculation_data: dict):
-        """
-        Generate PDF report for a calculation.
-
-        Args:
-            calculation_data: Complete calculation data (inputs + outputs)
-
-        Returns:
-            PDF file download
-        """
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                output_path = tmp.name
-
-            generate_pdf_report(calculation_data, output_path)
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Notes", _SUBHEADING_STYLE))
+    notes_text = (
+        "Rx Power (Without LNA Amplification) is the raw power at the receiver aperture. "
+        "Rx Power (With LNA Amplification) adds the Optical LNA gain directly to the raw Rx power. "
+        "Link Margin is computed using Rx Power WITH LNA Amplification minus Receiver Sensitivity. "
+        "Positive link margin means the link is viable. "
+        "A link margin of 3-6 dB is typically recommended for reliable operation. "
+        "This calculation assumes ideal atmospheric conditions. "
+        "Actual performance may vary based on environmental factors."
+    )
+    story.append(Paragraph(notes_text, _NORMAL_STYLE))
+
+    sweep_results = calculation_data.get('sweep_results')
+    if sweep_results:
+        story.append(PageBreak())
+        story.append(Paragraph("Parameter Sweep Analysis", _HEADING_STYLE))
+        story.append(Spacer(1, 0.2*inch))
+        
+        sweep_param_label = calculation_data.get('sweep_param_label', 'Sweep Parameter')
+        sweep_chart_base64 = calculation_data.get('sweep_chart_base64')
+        
+        if sweep_chart_base64:
+            try:
+                # Remove data:image/png;base64, prefix if it exists
+                if ',' in sweep_chart_base64:
+                    sweep_chart_base64 = sweep_chart_base64.split(',')[1]
+                
+                img_data = base64.b64decode(sweep_chart_base64)
+                img = Image(io.BytesIO(img_data))
+                
+                # Scale image to fit page width (letter width is 8.5 inches, margins are 0.75 each -> 7 inches available)
+                avail_width = 7 * inch
+                aspect = img.drawHeight / img.drawWidth
+                img.drawWidth = avail_width
+                img.drawHeight = avail_width * aspect
+                
+                story.append(img)
+                story.append(Spacer(1, 0.4*inch))
+            except Exception as e:
+                print(f"Failed to decode chart image: {e}")
+                
+        # Generate Table
+        story.append(Paragraph("Sweep Data Table", _SUBHEADING_STYLE))
+        story.append(Spacer(1, 0.1*inch))
+        
+        t_data = [[sweep_param_label, "Link Margin (dB)", "Rx Power LNA (dBm)", "Path Loss (dB)", "Viable?"]]
+        for r in sweep_results:
+            val = r.get('sweep_value', 0)
+            outputs_r = r.get('outputs', {})
+            lm = outputs_r.get('link_margin_db')
+            lm_str = f"{lm:.2f}" if lm is not None else "—"
+            rx_pwr = f"{outputs_r.get('received_power_lna_dbm', 0):.2f}"
+            path_loss = f"{outputs_r.get('path_loss_db', 0):.2f}"
+            viable = outputs_r.get('link_viable')
+            viable_str = "Yes" if viable is True else "No" if viable is False else "—"
+            
+            if val == 0:
+                val_str = "0"
+            elif abs(val) < 1e-3 or abs(val) > 1e4:
+                val_str = f"{val:.4e}"
+            else:
+                val_str = f"{val:.4f}"
+                
+            t_data.append([val_str, lm_str, rx_pwr, path_loss, viable_str])
+            
+        t_table = Table(t_data, colWidths=[1.7*inch, 1.2*inch, 1.5*inch, 1.3*inch, 1.0*inch])
+        t_table.setStyle(_SWEEP_TABLE_STYLE)
+        story.append(t_table)
+
+    watermark = _make_watermark(
+        f"Generated by Optical Link Budget Calculator | {now:%Y-%m-%d %H:%M:%S}")
+    doc.build(story, onFirstPage=watermark, onLaterPages=watermark)
+    return output
 
-            return FileResponse(
-                output_path,
-                media_type='application/pdf',
-                filename=f"optical_link_calculation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            )
 
-        except Exception as e:
-            from fastapi import HTTPException
-            raise HTTPException(status_code=500, detail=f"PDF generation error: {str(e)}")
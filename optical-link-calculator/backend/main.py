@@ -12,7 +12,7 @@ from datetime import datetime
 import json
 import os
 
-from calculations import OpticalLinkCalculator
+import calculations
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -30,9 +30,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize calculator
-calculator = OpticalLinkCalculator()
-
 # Create storage directory for saved calculations
 STORAGE_DIR = "saved_calculations"
 os.makedirs(STORAGE_DIR, exist_ok=True)
@@ -137,12 +134,12 @@ async def calculate_link_budget(inputs: LinkBudgetInput):
         params = inputs.dict()
         
         # Validate inputs
-        is_valid, error_msg = calculator.validate_inputs(params)
+        is_valid, error_msg = calculations.validate_inputs(params)
         if not is_valid:
             raise HTTPException(status_code=400, detail=error_msg)
         
         # Perform calculation
-        results = calculator.calculate_link_budget(params)
+        results = calculations.calculate_link_budget(params)
         
         return {
             "success": True,
@@ -297,9 +294,9 @@ async def convert_power(
         if from_unit.lower() == "dbm":
             dbm = value
         elif from_unit.lower() == "mw":
-            dbm = calculator.mw_to_dbm(value)
+            dbm = calculations.mw_to_dbm(value)
         elif from_unit.lower() == "w":
-            dbm = calculator.w_to_dbm(value)
+            dbm = calculations.w_to_dbm(value)
         else:
             raise HTTPException(status_code=400, detail=f"Unknown unit: {from_unit}")
         
@@ -307,9 +304,9 @@ async def convert_power(
         if to_unit.lower() == "dbm":
             result = dbm
         elif to_unit.lower() == "mw":
-            result = calculator.dbm_to_mw(dbm)
+            result = calculations.dbm_to_mw(dbm)
         elif to_unit.lower() == "w":
-            result = calculator.dbm_to_w(dbm)
+            result = calculations.dbm_to_w(dbm)
         else:
             raise HTTPException(status_code=400, detail=f"Unknown unit: {to_unit}")
         